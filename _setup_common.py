@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the setup and environment test scripts.
+
+Checking Java by running `java -version` spawns a JVM, which takes a noticeable
+moment on every run (especially on Windows). The result is cached in a small
+sentinel file and reused for as long as the java executable is unchanged.
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+JAVA_SENTINEL = Path.home() / ".pdf-extract" / "java_ok"
+
+
+def _read_sentinel(java_path):
+    """Return the cached version line if the sentinel matches java_path, else None."""
+    try:
+        cached_path, cached_mtime, version_line = JAVA_SENTINEL.read_text().split('\n', 2)
+    except (OSError, ValueError):
+        return None
+
+    if cached_path != java_path or cached_mtime != str(os.path.getmtime(java_path)):
+        return None
+    return version_line.strip()
+
+
+def _write_sentinel(java_path, version_line):
+    """Record a successful Java check."""
+    try:
+        JAVA_SENTINEL.parent.mkdir(parents=True, exist_ok=True)
+        JAVA_SENTINEL.write_text(f"{java_path}\n{os.path.getmtime(java_path)}\n{version_line}\n")
+    except OSError:
+        pass  # Caching is best effort
+
+
+def cached_java_check(java_path=None):
+    """
+    Check that Java runs, without spawning it when a cached result is still valid.
+
+    Args:
+        java_path: Java executable to check (defaults to `java` on the PATH)
+
+    Returns:
+        Tuple of (java executable path, version line), or None if Java is not usable
+    """
+    java_path = java_path or shutil.which("java")
+    if not java_path:
+        return None
+
+    version_line = _read_sentinel(java_path)
+    if version_line is not None:
+        return java_path, version_line
+
+    try:
+        result = subprocess.run([java_path, '-version'],
+                                capture_output=True, text=True, timeout=10)
+    except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    # Java version info goes to stderr
+    version_line = result.stderr.split('\n')[0] if result.stderr else "Unknown version"
+    _write_sentinel(java_path, version_line)
+    return java_path, version_line
@@ -11,19 +11,7 @@ from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Import the PDFTableExtractor class from our main script
-# Since the filename has a hyphen, we need to import it as a module
-import importlib.util
-import sys
-
-def load_pdf_extractor():
-    """Load the PDFTableExtractor class from pdf-extract.py"""
-    spec = importlib.util.spec_from_file_location("pdf_extract", "pdf-extract.py")
-    pdf_extract = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(pdf_extract)
-    return pdf_extract.PDFTableExtractor
-
-# Load the class
-PDFTableExtractor = load_pdf_extractor()
+from pdf_extract import PDFTableExtractor
 
 def example_usage():
     """Demonstrate various ways to use the PDF table extractor."""
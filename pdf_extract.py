@@ -0,0 +1,1495 @@
+#!/usr/bin/env python3
+"""
+PDF Table Extractor
+
+This script extracts tables from PDF files and converts them to CSV format.
+It supports multiple methods for table extraction to handle different types of PDFs.
+
+Folder Structure:
+- pdf_input/  - Place your PDF files here
+- csv_output/ - CSV files will be saved here
+
+Requirements:
+- tabula-py
+- pandas
+- pymupdf (optional, native table detection without Java)
+- pdfplumber (optional, pure-Python table detection without Java)
+- camelot-py[cv] (optional, for advanced table detection)
+- PyPDF2 (fallback option)
+
+Usage:
+    python pdf-extract.py input.pdf output.csv
+    python pdf-extract.py input.pdf  # Auto-generates output filename
+    python pdf-extract.py            # Interactive mode - searches pdf_input folder
+"""
+
+import sys
+import os
+import select
+import functools
+import hashlib
+import itertools
+import json
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Resolve the project folders once at import instead of on every call
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_PDF_INPUT_DIR = _SCRIPT_DIR / "pdf_input"
+_CSV_OUTPUT_DIR = _SCRIPT_DIR / "csv_output"
+_CACHE_DIR = _CSV_OUTPUT_DIR / ".cache"
+
+# Pre-scan thresholds for skipping table-less pages before camelot runs:
+# a page is a candidate if it has this many vector drawings (ruling lines)
+# or this many text blocks (a grid of cells for stream detection)
+_MIN_TABLE_DRAWINGS = 4
+_MIN_TABLE_TEXT_BLOCKS = 6
+
+# Seconds to wait at the "select a file" prompt before using the first file
+_PROMPT_TIMEOUT = 5.0
+
+# Set once csv_output has been created so later saves skip the mkdir call
+_csv_dir_ready = False
+
+
+def _ensure_csv_output_dir():
+    """Create the csv_output folder on first use and return its path."""
+    global _csv_dir_ready
+    if not _csv_dir_ready:
+        _CSV_OUTPUT_DIR.mkdir(exist_ok=True)
+        _csv_dir_ready = True
+    return _CSV_OUTPUT_DIR
+
+
+def _pyarrow_layout_matches(table):
+    """
+    Check the parts of a table where pyarrow's unquoted CSV differs from to_csv.
+    
+    pyarrow writes a None/NaN column label as 'nan' where pandas leaves the
+    field empty, and in a one-column table it writes an empty cell as a blank
+    line (which CSV readers skip) where pandas writes "".
+    """
+    from pandas.api.types import is_integer
+    
+    if table.shape[1] == 0:
+        return False
+    if not all(isinstance(label, str) or is_integer(label) for label in table.columns):
+        return False
+    if table.shape[1] == 1:
+        column = table.iloc[:, 0]
+        if table.columns[0] == '' or column.isna().any() or (column == '').any():
+            return False
+    return True
+
+
+def _write_csv(table, path):
+    """
+    Write a DataFrame to CSV, using pyarrow's C++ writer when available.
+    
+    pyarrow is only used where its output matches pandas.to_csv: string and
+    integer columns, written unquoted. Anything it would format differently
+    (floats, booleans, cells or headers that need quoting, missing labels,
+    blank cells in a one-column table) goes through pandas.to_csv instead,
+    so every file has the same format either way.
+    """
+    pa = _pyarrow()
+    if pa is not None and _pyarrow_layout_matches(table):
+        try:
+            # safe=False skips overflow/truncation checks during type conversion;
+            # extracted tables are mostly wide object (string) columns
+            arrow_table = pa.Table.from_pandas(table, preserve_index=False, safe=False)
+            if all(pa.types.is_string(t) or pa.types.is_large_string(t)
+                   or pa.types.is_integer(t) or pa.types.is_null(t)
+                   for t in arrow_table.schema.types):
+                # 'none' raises ArrowInvalid on a value that needs quotes
+                options = pa.csv.WriteOptions(quoting_style='none', quoting_header='none',
+                                              eol=os.linesep)
+                pa.csv.write_csv(arrow_table, str(path), options)
+                return
+        except (pa.ArrowException, ValueError, TypeError):
+            pass  # TypeError also covers pyarrow releases without these options
+    
+    table.to_csv(path, index=False)
+
+
+# Optional backends are imported on first use rather than at module import:
+# camelot pulls in OpenCV and tabula probes for a JVM, which made even
+# `--help` slow. Each loader is cached, so the import (and the warning for a
+# missing package) happens at most once per process.
+
+@functools.lru_cache(maxsize=None)
+def _tabula():
+    """Import tabula-py on first use. Returns the module, or None if not installed."""
+    try:
+        import tabula
+        return tabula
+    except ImportError:
+        print("Warning: tabula-py not installed. Install with: pip install tabula-py")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _camelot():
+    """Import camelot-py on first use. Returns the module, or None if not installed."""
+    try:
+        import camelot
+        return camelot
+    except ImportError:
+        print("Warning: camelot-py not installed. Install with: pip install camelot-py[cv]")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _pymupdf():
+    """Import pymupdf on first use. Returns the module, or None if not installed."""
+    try:
+        import pymupdf
+        return pymupdf
+    except ImportError:
+        print("Warning: pymupdf not installed. Install with: pip install pymupdf")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _pdfplumber():
+    """Import pdfplumber on first use. Returns the module, or None if not installed."""
+    try:
+        import pdfplumber
+        return pdfplumber
+    except ImportError:
+        print("Warning: pdfplumber not installed. Install with: pip install pdfplumber")
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _pyarrow():
+    """Import pyarrow (with its csv module) on first use. Returns the module, or None."""
+    try:
+        import pyarrow
+        import pyarrow.csv
+        return pyarrow
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _blake3():
+    """Import the blake3 hasher on first use. Returns the class, or None if not installed."""
+    try:
+        from blake3 import blake3
+        return blake3
+    except ImportError:
+        return None
+
+
+def _file_digest(path):
+    """
+    Hash a file's contents for use as a cache key.
+    
+    Uses BLAKE3 (SIMD and multi-threaded) when the blake3 package is
+    installed, else MD5, which is plenty for identifying a file (this is not
+    a security check) and cheaper than SHA-256. The file is streamed rather
+    than read into one bytes object.
+    """
+    blake3 = _blake3()
+    with open(path, 'rb') as f:
+        if blake3 is not None:
+            digest = blake3(max_threads=blake3.AUTO)
+        elif hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+        else:
+            digest = hashlib.md5()
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def _normalize_text(table):
+    """
+    Return a copy of table with NFKC-normalized, whitespace-collapsed text cells.
+    
+    Uses pandas' vectorized string methods per column rather than a Python
+    loop over cells; non-string cells are left untouched.
+    """
+    from pandas.api.types import infer_dtype
+    
+    table = table.copy(deep=False)
+    for position in range(table.shape[1]):
+        column = table.iloc[:, position]
+        # Object columns may hold only numbers or booleans, which .str rejects
+        if infer_dtype(column, skipna=True) not in ('string', 'mixed', 'mixed-integer'):
+            continue
+        cleaned = (column.str.normalize('NFKC')
+                         .str.replace(r'\s+', ' ', regex=True)
+                         .str.strip())
+        # .str yields NaN for non-string cells; keep the original value there
+        table.isetitem(position, cleaned.where(cleaned.notna(), column))
+    return table
+
+
+def _infer_types(table):
+    """
+    Return a copy of table with all-numeric text columns converted to numbers.
+    
+    Extracted cells arrive as strings, so every column is text. A column is
+    converted only if every non-empty cell parses as a number, so text such
+    as a header row kept in the data (camelot) is never lost. Whole-number
+    columns use the nullable Int64 dtype so "1" is not written as 1.0.
+    """
+    import pandas as pd
+    from pandas.api.types import infer_dtype
+    
+    table = table.copy(deep=False)
+    for position in range(table.shape[1]):
+        column = table.iloc[:, position]
+        if infer_dtype(column, skipna=True) not in ('string', 'mixed', 'mixed-integer'):
+            continue
+        
+        blank = column.isna() | (column.astype('string').str.strip() == '')
+        coerced = pd.to_numeric(column.where(~blank), errors='coerce')
+        if blank.all() or not (coerced.notna() | blank).all():
+            continue
+        
+        values = coerced.dropna()
+        if (values % 1 == 0).all() and values.abs().max() < 2 ** 53:
+            coerced = coerced.astype('Int64')
+        table.isetitem(position, coerced)
+    return table
+
+
+def _expand_pages(pages, page_count=None):
+    """
+    Turn a page spec into a list of page numbers (1-based).
+    
+    Accepts 'all', a list of numbers, or a camelot-style string such as
+    '1,3,5-7' or '2-end'.
+    
+    Args:
+        pages: Page spec to expand
+        page_count: Number of pages in the PDF, needed for 'all' and 'end'
+    
+    Returns:
+        List of page numbers, or None if the spec needs an unknown page_count
+    
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    if not isinstance(pages, str):
+        return [int(p) for p in pages]
+    if pages == 'all':
+        return None if page_count is None else list(range(1, page_count + 1))
+    
+    page_list = []
+    for part in pages.split(','):
+        first, dash, last = part.strip().partition('-')
+        if not dash:
+            page_list.append(int(first))
+            continue
+        if last.strip() == 'end':
+            if page_count is None:
+                return None
+            last = page_count
+        page_list.extend(range(int(first), int(last) + 1))
+    return page_list
+
+
+def _max_columns(tables):
+    """Return the widest column count across tables (0 for an empty list)."""
+    return max((table.shape[1] for table in tables), default=0)
+
+
+def _input_with_timeout(prompt, timeout):
+    """
+    Read a line from stdin, returning '' if nothing is entered within timeout seconds.
+    
+    Windows consoles can't be polled with select(), so there this is a plain input().
+    """
+    if os.name == 'nt':
+        return input(prompt).strip()
+    
+    print(prompt, end='', flush=True)
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        print()
+        return ''
+    return sys.stdin.readline().strip()
+
+
+def find_pdf_files_in_directory(directory=None):
+    """
+    Find all PDF files in the specified directory.
+    
+    Args:
+        directory: Directory to search (defaults to pdf_input folder)
+    
+    Returns:
+        List of PDF file paths
+    """
+    if directory is None:
+        # Default to pdf_input folder in the script's directory
+        directory = _PDF_INPUT_DIR
+    
+    # Single directory listing; the suffix check also catches ".PDF"
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.name for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith('.pdf')]
+    except FileNotFoundError:
+        return []
+
+
+def select_pdf_file_automatically(assume_yes=False, allow_multiple=False):
+    """
+    Automatically select a PDF file from the pdf_input directory.
+    
+    When several files are found the user is prompted; an unanswered prompt
+    falls back to the first file after _PROMPT_TIMEOUT seconds.
+    
+    Args:
+        assume_yes: Pick the first file instead of prompting when several are found
+        allow_multiple: If stdin is not a terminal, return every file found
+            instead of prompting (used for unattended batch runs)
+    
+    Returns:
+        Path to selected PDF file (or a list of paths, see allow_multiple),
+        or None if no files found
+    """
+    pdf_files = find_pdf_files_in_directory()
+    
+    if not pdf_files:
+        return None
+    elif len(pdf_files) == 1:
+        print(f"Found PDF file: {pdf_files[0]}")
+        # Return full path to the file in pdf_input directory
+        return str(_PDF_INPUT_DIR / pdf_files[0])
+    else:
+        print(f"Found {len(pdf_files)} PDF files in pdf_input folder:")
+        for i, pdf_file in enumerate(pdf_files, 1):
+            print(f"  {i}. {pdf_file}")
+        
+        if assume_yes:
+            print(f"Using: {pdf_files[0]}")
+            return str(_PDF_INPUT_DIR / pdf_files[0])
+        
+        if allow_multiple and not sys.stdin.isatty():
+            print("Not running in a terminal, processing all files")
+            return [str(_PDF_INPUT_DIR / pdf_file) for pdf_file in pdf_files]
+        
+        while True:
+            try:
+                choice = _input_with_timeout(
+                    f"\nSelect a file (1-{len(pdf_files)}) or press Enter for first file: ",
+                    _PROMPT_TIMEOUT
+                )
+                if not choice:
+                    selected = pdf_files[0]
+                    print(f"Using: {selected}")
+                    return str(_PDF_INPUT_DIR / selected)
+                
+                choice_idx = int(choice) - 1
+                if 0 <= choice_idx < len(pdf_files):
+                    return str(_PDF_INPUT_DIR / pdf_files[choice_idx])
+                else:
+                    print(f"Please enter a number between 1 and {len(pdf_files)}")
+            except ValueError:
+                print("Please enter a valid number")
+
+
+def get_pdf_file_path():
+    """
+    Get PDF file path with automatic detection fallback.
+    
+    Returns:
+        Path to PDF file
+    """
+    # First try to find PDF files in pdf_input directory
+    auto_pdf = select_pdf_file_automatically()
+    
+    if auto_pdf:
+        return auto_pdf
+    
+    # If no PDF files found, ask user for input
+    print("No PDF files found in pdf_input directory.")
+    pdf_file = input("Enter PDF file path: ").strip().strip('"')
+    return pdf_file if pdf_file else None
+
+
+def _extract_page_chunk(pdf_path, pdf_hash, pages, method, options):
+    """
+    Extract tables from a subset of pages in a worker process.
+    
+    Kept at module level so the process pool can pickle it. The cache is
+    not used here: the parent caches the combined result of all chunks.
+    The backend is called directly, without _run_extraction's fallbacks,
+    which the parent applies to the run as a whole.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        pdf_hash: Content hash the parent already computed for pdf_path
+        pages: List of page numbers (1-based) handled by this worker
+        method: Backend to run ('pymupdf', 'pdfplumber', 'tabula' or 'camelot')
+        options: Extra keyword arguments for the backend (flavor, tolerances, ...)
+    
+    Returns:
+        Tuple of (first page of the chunk, list of DataFrames found on those pages)
+    """
+    # The parent process already resolved and hashed this path
+    extractor = PDFTableExtractor(pdf_path, _already_validated=True, _pdf_hash=pdf_hash)
+    extract = getattr(extractor, f"extract_with_{method}")
+    return pages[0], extract(pages=pages, **options)
+
+
+def _extract_pdf_to_csv(pdf_path, method, extract_params, save_options, force_refresh=False):
+    """
+    Extract and save the tables of one PDF in a worker process (batch mode).
+    
+    Kept at module level so the process pool can pickle it.
+    
+    Returns:
+        List of saved CSV file paths (as strings)
+    """
+    extractor = PDFTableExtractor(pdf_path, _already_validated=True)
+    tables = extractor.extract_tables(method=method, force_refresh=force_refresh, **extract_params)
+    return [str(path) for path in extractor.save_tables_to_csv(tables, **save_options)]
+
+
+class PDFTableExtractor:
+    """Extract tables from PDF files using multiple methods."""
+    
+    def __init__(self, pdf_path, _already_validated=False, _pdf_hash=None):
+        """
+        Args:
+            pdf_path: Path to the PDF file (also looked up in pdf_input)
+            _already_validated: Internal; the caller found pdf_path on disk
+                already (e.g. via a directory scan), so skip the existence check
+            _pdf_hash: Internal; content hash the caller already computed
+                (page-parallel workers), so the file is not hashed again
+        """
+        self.pdf_path = Path(pdf_path)
+        
+        # If the file doesn't exist, try looking in the pdf_input folder
+        if not _already_validated and not self.pdf_path.is_file():
+            pdf_input_path = _PDF_INPUT_DIR / self.pdf_path.name
+            
+            if pdf_input_path.is_file():
+                print(f"PDF file found in pdf_input folder: {pdf_input_path}")
+                self.pdf_path = pdf_input_path
+            else:
+                raise FileNotFoundError(f"PDF file not found: {pdf_path}\nAlso checked: {pdf_input_path}")
+        
+        # String form handed to the backends and worker processes, built once
+        self._pdf_str = str(self.pdf_path.resolve())
+        
+        # Content hash used as the cache key, so renamed copies still hit
+        self.pdf_hash = _pdf_hash or _file_digest(self._pdf_str)
+        
+        # Guards the shared pymupdf document (not thread-safe) in case an
+        # extractor is used from several threads
+        self._doc_lock = threading.Lock()
+    
+    @functools.cached_property
+    def _pdf_doc(self):
+        """The PDF parsed once by pymupdf and reused by every page-level helper."""
+        return _pymupdf().open(self._pdf_str)
+    
+    def close(self):
+        """Release the parsed PDF document, if it was opened."""
+        doc = self.__dict__.pop('_pdf_doc', None)
+        if doc is not None:
+            doc.close()
+    
+    def __del__(self):
+        self.close()
+    
+    def extract_with_pymupdf(self, pages='all'):
+        """
+        Extract tables using PyMuPDF's native table finder (no JVM required).
+        
+        Args:
+            pages: Page numbers to extract from ('all' or list of page numbers, 1-based)
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        pymupdf = _pymupdf()
+        if pymupdf is None:
+            raise ImportError("pymupdf is required for this method")
+        
+        try:
+            print(f"Extracting tables from {self.pdf_path} using pymupdf...")
+            
+            tables = []
+            with self._doc_lock:
+                doc = self._pdf_doc
+                if pages == 'all':
+                    page_numbers = range(doc.page_count)
+                else:
+                    page_numbers = [int(p) - 1 for p in pages]
+                
+                for page_number in page_numbers:
+                    page = doc[page_number]
+                    for table in page.find_tables().tables:
+                        tables.append(table.to_pandas())
+            
+            print(f"Found {len(tables)} table(s)")
+            return tables
+            
+        except Exception as e:
+            print(f"Error extracting with pymupdf: {e}")
+            return []
+    
+    def extract_with_pdfplumber(self, pages='all'):
+        """
+        Extract tables using pdfplumber's ruling-line detection (no JVM required).
+        
+        Args:
+            pages: Page numbers to extract from ('all' or list of page numbers, 1-based)
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        pdfplumber = _pdfplumber()
+        if pdfplumber is None:
+            raise ImportError("pdfplumber is required for this method")
+        
+        try:
+            import pandas as pd
+            print(f"Extracting tables from {self.pdf_path} using pdfplumber...")
+            
+            table_settings = {'vertical_strategy': 'lines', 'horizontal_strategy': 'lines'}
+            tables = []
+            with pdfplumber.open(self._pdf_str) as pdf:
+                if pages == 'all':
+                    selected_pages = pdf.pages
+                else:
+                    selected_pages = [pdf.pages[int(p) - 1] for p in pages]
+                
+                for page in selected_pages:
+                    for rows in page.extract_tables(table_settings=table_settings):
+                        if rows:
+                            # First row is the header, as with tabula's header=0
+                            tables.append(pd.DataFrame(rows[1:], columns=rows[0]))
+            
+            print(f"Found {len(tables)} table(s)")
+            return tables
+            
+        except Exception as e:
+            print(f"Error extracting with pdfplumber: {e}")
+            return []
+    
+    def extract_with_tabula(self, pages='all', multiple_tables=True):
+        """
+        Extract tables using tabula-py.
+        
+        Args:
+            pages: Page numbers to extract from ('all' or list of page numbers)
+            multiple_tables: Whether to extract multiple tables per page
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        tabula = _tabula()
+        if tabula is None:
+            raise ImportError("tabula-py is required for this method")
+        
+        try:
+            print(f"Extracting tables from {self.pdf_path} using tabula...")
+            
+            # Extract tables from PDF
+            # force_subprocess=False runs tabula in-process through jpype, so the
+            # JVM is started once and reused by every later call in this process
+            tables = tabula.read_pdf(
+                self._pdf_str,
+                pages=pages,
+                multiple_tables=multiple_tables,
+                pandas_options={'header': 0},
+                force_subprocess=False
+            )
+            
+            print(f"Found {len(tables)} table(s)")
+            return tables
+            
+        except Exception as e:
+            print(f"Error extracting with tabula: {e}")
+            return []
+    
+    @functools.cached_property
+    def _candidate_pages(self):
+        """
+        Cheaply find pages that may contain a table (computed once per extractor).
+        
+        Uses pymupdf to count vector drawings and text blocks per page, which
+        is far cheaper than running camelot's detection on every page. The
+        heuristic can miss sparse borderless tables, so it is only used when
+        a caller asks for it (prescan=True).
+        
+        Returns:
+            List of page numbers (1-based), or None if pymupdf is not available
+        """
+        if _pymupdf() is None:
+            return None
+        
+        candidates = []
+        with self._doc_lock:
+            for page in self._pdf_doc:
+                if (len(page.get_drawings()) >= _MIN_TABLE_DRAWINGS
+                        or len(page.get_text("blocks")) >= _MIN_TABLE_TEXT_BLOCKS):
+                    candidates.append(page.number + 1)
+        return candidates
+    
+    def extract_with_camelot(self, pages='all', flavor='stream', prescan=False, **camelot_kwargs):
+        """
+        Extract tables using camelot-py with enhanced column detection.
+        
+        Args:
+            pages: Page numbers to extract from ('all' or '1,2,3')
+            flavor: 'stream' or 'lattice' detection method
+            prescan: With pages='all', skip pages that don't look like they hold a table
+                (faster, but a sparse borderless table can be missed)
+            **camelot_kwargs: Additional camelot parameters for fine-tuning
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        camelot = _camelot()
+        if camelot is None:
+            raise ImportError("camelot-py is required for this method")
+        
+        try:
+            print(f"Extracting tables from {self.pdf_path} using camelot ({flavor})...")
+            
+            if isinstance(pages, (list, tuple)):
+                # camelot expects pages as a comma-separated string
+                pages = ','.join(map(str, pages))
+            
+            # Restrict a whole-document run to pages that look like they hold tables
+            if pages == 'all' and prescan:
+                candidates = self._candidate_pages
+                if candidates:
+                    print(f"Scanning {len(candidates)} candidate page(s)")
+                    pages = ','.join(map(str, candidates))
+                elif candidates is not None:
+                    # The heuristic can miss sparse borderless tables, so don't give up
+                    print("No pages look like they contain tables, scanning all pages")
+            
+            # Enhanced parameters for better column detection
+            default_params = {
+                'pages': pages,
+                'flavor': flavor
+            }
+            
+            # Stream-specific optimizations for column detection
+            if flavor == 'stream':
+                stream_defaults = {
+                    'table_areas': None,  # Let camelot auto-detect
+                    'columns': None,      # Let camelot auto-detect columns
+                    'split_text': False,  # Don't split text within cells
+                    'strip_text': '\n',   # Remove newlines from cells
+                    'row_tol': 2,        # Tolerance for row detection
+                    'column_tol': 0      # Tolerance for column detection (0 = strict)
+                }
+                default_params.update(stream_defaults)
+            
+            # Lattice-specific optimizations
+            elif flavor == 'lattice':
+                lattice_defaults = {
+                    'table_areas': None,     # Let camelot auto-detect
+                    'process_background': False,  # Don't process background
+                    'line_scale': 15,        # Line detection sensitivity
+                    'copy_text': None,       # Text extraction method
+                    'shift_text': [''],      # Text shifting rules
+                    'split_text': False,     # Don't split text within cells
+                    'strip_text': '\n'       # Remove newlines from cells
+                }
+                default_params.update(lattice_defaults)
+            
+            # Override with user-provided parameters
+            default_params.update(camelot_kwargs)
+            
+            # Extract tables from PDF
+            tables = camelot.read_pdf(self._pdf_str, **default_params)
+            
+            print(f"Found {len(tables)} table(s)")
+            
+            # Display detection confidence for debugging while collecting DataFrames
+            dataframes = []
+            for i, table in enumerate(tables, 1):
+                df = table.df
+                accuracy = getattr(table, 'accuracy', None)
+                if accuracy is not None:
+                    print(f"  Table {i}: {df.shape[0]} rows × {df.shape[1]} columns (accuracy: {accuracy:.1f}%)")
+                else:
+                    print(f"  Table {i}: {df.shape[0]} rows × {df.shape[1]} columns")
+                dataframes.append(df)
+            
+            return dataframes
+            
+        except Exception as e:
+            print(f"Error extracting with camelot: {e}")
+            return []
+    
+    def _cache_key(self, method, kwargs):
+        """Build the cache key for one extraction request."""
+        options = dict(kwargs)
+        pages = options.setdefault('pages', 'all')
+        if isinstance(pages, tuple):
+            options['pages'] = list(pages)
+        
+        # The page spec is hashed along with the other options (flavor,
+        # tolerances, ...): camelot's '1,3' and '1-3' must not share a key,
+        # and a long page list would not fit in a folder name
+        options_hash = hashlib.sha256(repr(sorted(options.items())).encode()).hexdigest()[:16]
+        
+        return f"{self.pdf_hash}_{method}_{options_hash}"
+    
+    def _load_cached_tables(self, cache_key):
+        """Load tables from the cache, or return None on a miss."""
+        cache_entry = _CACHE_DIR / cache_key
+        if not cache_entry.is_dir():
+            return None
+        
+        try:
+            table_files = sorted(cache_entry.glob("table_*.parquet"),
+                                 key=lambda f: int(f.stem.split('_')[1]))
+            import pandas as pd
+            tables = [pd.read_parquet(f) for f in table_files]
+            
+            # Restore the original labels (None, NaN, integers, duplicates)
+            # that Parquet can't store
+            labels_file = cache_entry / "columns.json"
+            if labels_file.exists():
+                labels = json.loads(labels_file.read_text())
+                tables = [table.set_axis(table_labels, axis=1)
+                          for table, table_labels in zip(tables, labels)]
+        except Exception as e:
+            print(f"Warning: could not read cached tables: {e}")
+            return None
+        
+        print(f"Loaded {len(tables)} table(s) from cache")
+        return tables
+    
+    def _cache_tables(self, cache_key, tables):
+        """
+        Write tables to the cache as Parquet files while passing them through.
+        
+        Tables go to a staging folder that only becomes the cache entry once
+        the iterable is exhausted, so an interrupted run never leaves a
+        partial entry that would later be read as a hit. The staging folder
+        is unique per run: batch mode may cache identical PDFs (same key)
+        from several processes at once.
+        """
+        staging = None
+        caching = True
+        count = 0
+        labels = []
+        try:
+            for table in tables:
+                count += 1
+                if caching:
+                    try:
+                        if staging is None:
+                            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                            staging = Path(tempfile.mkdtemp(dir=_CACHE_DIR, prefix=f"{cache_key}.",
+                                                            suffix=".partial"))
+                        # Parquet requires unique string column names, so columns are
+                        # stored by position and the original labels in columns.json
+                        labels.append([label.item() if hasattr(label, 'item') else label
+                                       for label in table.columns])
+                        cached = table.set_axis([str(i) for i in range(table.shape[1])], axis=1)
+                        cached.to_parquet(staging / f"table_{count}.parquet", index=False, compression='zstd')
+                    except Exception as e:
+                        print(f"Warning: could not cache extracted tables: {e}")
+                        caching = False
+                yield table
+            
+            if caching and count:
+                final = _CACHE_DIR / cache_key
+                try:
+                    (staging / "columns.json").write_text(json.dumps(labels))
+                    # A forced refresh replaces the entry from an earlier run
+                    if final.exists():
+                        shutil.rmtree(final, ignore_errors=True)
+                    staging.rename(final)
+                except (OSError, TypeError, ValueError) as e:  # TypeError: label json can't hold
+                    # Losing a race to another process caching the same PDF is fine
+                    if not final.is_dir():
+                        print(f"Warning: could not cache extracted tables: {e}")
+        finally:
+            if staging is not None and staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+    
+    def _store_cached_tables(self, cache_key, tables):
+        """Write a complete list of tables to the cache as Parquet files."""
+        for _ in self._cache_tables(cache_key, tables):
+            pass
+    
+    def extract_tables(self, method='auto', force_refresh=False, **kwargs):
+        """
+        Extract tables using the specified method.
+        
+        Results are cached in csv_output/.cache keyed by the PDF content hash,
+        method and options, so repeated runs on the same file skip extraction.
+        
+        Args:
+            method: 'pymupdf', 'pdfplumber', 'tabula', 'camelot', or 'auto' to try each in turn
+            force_refresh: Ignore any cached result and extract again
+            **kwargs: Additional arguments for extraction methods
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        cache_key = self._cache_key(method, kwargs)
+        
+        if not force_refresh:
+            tables = self._load_cached_tables(cache_key)
+            if tables is not None:
+                return tables
+        
+        tables = self._run_extraction(method, **kwargs)
+        
+        if tables:
+            self._store_cached_tables(cache_key, tables)
+        
+        return tables
+    
+    def _run_extraction(self, method, **kwargs):
+        """Run the extraction backends for extract_tables without caching."""
+        tables = []
+        
+        if method == 'auto':
+            # Try the native backends first (no JVM startup): pymupdf, then pdfplumber,
+            # then tabula, then camelot. Heavier backends are only imported if the
+            # earlier ones come up empty.
+            prescan = kwargs.pop('prescan', False)  # camelot-only option
+            pymupdf_available = _pymupdf() is not None
+            if pymupdf_available:
+                tables = self.extract_with_pymupdf(**kwargs)
+            
+            pdfplumber_available = False
+            if not tables:
+                pdfplumber_available = _pdfplumber() is not None
+                if pdfplumber_available:
+                    if pymupdf_available:
+                        print("PyMuPDF didn't find tables, trying pdfplumber...")
+                    tables = self.extract_with_pdfplumber(**kwargs)
+            
+            native_tried = pymupdf_available or pdfplumber_available
+            if not tables:
+                tabula_available = _tabula() is not None
+                camelot_available = _camelot() is not None
+                
+                if tabula_available:
+                    if native_tried:
+                        print("Native backends didn't find tables, trying tabula...")
+                    tables = self.extract_with_tabula(**kwargs)
+                
+                # camelot only runs if tabula came up empty, so the usual
+                # tabula-success case never waits on it
+                if not tables and camelot_available:
+                    if tabula_available:
+                        print("Tabula didn't find tables, trying camelot...")
+                    else:
+                        print("Trying camelot...")
+                    tables = self.extract_with_camelot(flavor='stream', prescan=prescan, **kwargs)
+                
+                # If stream didn't work well, try lattice
+                if not tables and camelot_available:
+                    print("Stream flavor didn't find tables, trying lattice...")
+                    tables = self.extract_with_camelot(flavor='lattice', prescan=prescan, **kwargs)
+                
+        elif method == 'pymupdf':
+            tables = self.extract_with_pymupdf(**kwargs)
+            
+        elif method == 'pdfplumber':
+            tables = self.extract_with_pdfplumber(**kwargs)
+            
+        elif method == 'tabula':
+            tables = self.extract_with_tabula(**kwargs)
+            
+        elif method == 'camelot':
+            # Enhanced camelot extraction with both flavors if needed
+            tables = self._camelot_with_lattice_retry(self.extract_with_camelot, kwargs)
+            
+        else:
+            raise ValueError(f"Unknown method: {method}")
+        
+        return tables
+    
+    def _camelot_with_lattice_retry(self, extract, kwargs):
+        """
+        Run camelot, retrying with the lattice flavor if stream finds too few columns.
+        
+        Args:
+            extract: Callable running camelot with the given keyword arguments
+                (extract_with_camelot, or a page-parallel equivalent)
+            kwargs: Keyword arguments for extract
+        
+        Returns:
+            List of DataFrames from whichever flavor found more columns
+        """
+        flavor = kwargs.get('flavor', 'stream')
+        tables = extract(**kwargs)
+        
+        # If we got tables but they seem to have too few columns, try the other flavor
+        if tables and flavor == 'stream':
+            # Check if tables might be missing columns (heuristic)
+            stream_cols = _max_columns(tables)
+            if stream_cols <= 2:  # Suspiciously few columns
+                print(f"Only found {stream_cols} column(s) with stream flavor, trying lattice...")
+                lattice_kwargs = kwargs.copy()
+                lattice_kwargs['flavor'] = 'lattice'
+                lattice_tables = extract(**lattice_kwargs)
+                
+                lattice_cols = _max_columns(lattice_tables)
+                if lattice_cols > stream_cols:
+                    print(f"Lattice found {lattice_cols} column(s), using lattice results")
+                    tables = lattice_tables
+        
+        return tables
+    
+    def count_pages(self):
+        """
+        Count the pages in the PDF.
+        
+        Returns:
+            Number of pages, or None if pymupdf is not available
+        """
+        if _pymupdf() is None:
+            return None
+        
+        with self._doc_lock:
+            return self._pdf_doc.page_count
+    
+    def _auto_stages(self):
+        """
+        Yield the backends auto mode tries in turn, as (method, options) pairs.
+        
+        Follows the fallback order of _run_extraction, so a page-parallel
+        auto run settles on one backend for the whole document instead of
+        letting each chunk fall back on its own. Each backend is only
+        imported once the previous stages have come up empty.
+        """
+        if _pymupdf() is not None:
+            yield 'pymupdf', {}
+        if _pdfplumber() is not None:
+            yield 'pdfplumber', {}
+        if _tabula() is not None:
+            yield 'tabula', {}
+        if _camelot() is not None:
+            yield 'camelot', {'flavor': 'stream'}
+            yield 'camelot', {'flavor': 'lattice'}
+    
+    def iter_tables_parallel(self, pages='all', method='auto', workers=None, force_refresh=False, **kwargs):
+        """
+        Extract tables with the page range split across worker processes,
+        yielding each table as soon as it is available.
+        
+        Table detection is independent per page, so each worker handles a
+        contiguous chunk of pages. A chunk's tables are yielded once it and
+        every earlier chunk have finished, so tables always come out in page
+        order while later chunks are still running. Processes are used rather
+        than threads because camelot's Ghostscript backend is not thread-safe.
+        
+        In auto mode each backend is run across all pages before falling back
+        to the next one, so every table of a run comes from the same backend.
+        
+        Args:
+            pages: 'all', list of page numbers (1-based) or a camelot-style
+                string such as '1,3,5-7' or '2-end'
+            method: Extraction method passed on to extract_tables
+            workers: Number of worker processes (defaults to min(CPU count, 4))
+            force_refresh: Ignore any cached result and extract again
+            **kwargs: Additional arguments for the extraction methods
+        
+        Yields:
+            DataFrames containing extracted tables, in page order
+        """
+        cache_key = self._cache_key(method, dict(kwargs, pages=pages))
+        if not force_refresh:
+            tables = self._load_cached_tables(cache_key)
+            if tables is not None:
+                yield from tables
+                return
+        
+        workers = workers or min(os.cpu_count() or 1, 4)
+        page_list = None
+        if workers > 1:
+            needs_count = pages == 'all' or (isinstance(pages, str) and 'end' in pages)
+            try:
+                page_list = _expand_pages(pages, self.count_pages() if needs_count else None)
+            except ValueError:
+                pass
+            if page_list is None:
+                print(f"Cannot split pages {pages!r} across workers, extracting serially...")
+        
+        if page_list is None or min(workers, len(page_list)) <= 1:
+            yield from self.extract_tables(method=method, pages=pages, force_refresh=force_refresh, **kwargs)
+            return
+        
+        # The camelot pre-scan runs here once; workers get explicit page lists
+        prescan = kwargs.get('prescan', False)
+        options = {k: v for k, v in kwargs.items() if k != 'prescan'}
+        stages = self._auto_stages() if method == 'auto' else [(method, {})]
+        
+        def _in_page_order(executor, stage_pages, stage_method, stage_options):
+            # Split pages into contiguous chunks, one per worker
+            stage_workers = min(workers, len(stage_pages))
+            chunk_size, remainder = divmod(len(stage_pages), stage_workers)
+            chunks = []
+            start = 0
+            for i in range(stage_workers):
+                end = start + chunk_size + (1 if i < remainder else 0)
+                chunks.append(stage_pages[start:end])
+                start = end
+            
+            label = stage_method
+            if 'flavor' in stage_options:
+                label += f" ({stage_options['flavor']})"
+            print(f"Extracting {len(stage_pages)} page(s) with {label} "
+                  f"on {stage_workers} worker process(es)...")
+            
+            chunk_starts = [chunk[0] for chunk in chunks]
+            next_chunk = 0
+            finished = {}
+            futures = [executor.submit(_extract_page_chunk, self._pdf_str, self.pdf_hash,
+                                       chunk, stage_method, stage_options)
+                       for chunk in chunks]
+            for future in as_completed(futures):
+                first_page, chunk_tables = future.result()
+                finished[first_page] = chunk_tables
+                # Chunks finish in any order; release them in page order
+                while next_chunk < len(chunk_starts) and chunk_starts[next_chunk] in finished:
+                    yield from finished.pop(chunk_starts[next_chunk])
+                    next_chunk += 1
+        
+        def _first_stage_with_tables():
+            from concurrent.futures import ProcessPoolExecutor
+            
+            with ProcessPoolExecutor(max_workers=min(workers, len(page_list))) as executor:
+                for stage_method, stage_options in stages:
+                    stage_pages = page_list
+                    if stage_method == 'camelot' and pages == 'all' and prescan:
+                        # Falls back to every page if the heuristic finds nothing
+                        stage_pages = self._candidate_pages or page_list
+                    
+                    if method == 'camelot':
+                        # The stream -> lattice retry needs every chunk's tables,
+                        # so one flavor is picked for the whole run
+                        def _extract_all(**camelot_options):
+                            return list(_in_page_order(executor, stage_pages, 'camelot',
+                                                       camelot_options))
+                        yield from self._camelot_with_lattice_retry(_extract_all, options)
+                        return
+                    
+                    found = 0
+                    for table in _in_page_order(executor, stage_pages, stage_method,
+                                                dict(options, **stage_options)):
+                        found += 1
+                        yield table
+                    if found:
+                        return
+        
+        count = 0
+        for table in self._cache_tables(cache_key, _first_stage_with_tables()):
+            count += 1
+            yield table
+        print(f"Found {count} table(s) across all workers")
+    
+    def extract_tables_parallel(self, pages='all', method='auto', workers=None, force_refresh=False, **kwargs):
+        """
+        Extract tables with the page range split across worker processes.
+        
+        Same as iter_tables_parallel, but collects the tables into a list.
+        
+        Returns:
+            List of DataFrames containing extracted tables
+        """
+        return list(self.iter_tables_parallel(pages=pages, method=method, workers=workers,
+                                              force_refresh=force_refresh, **kwargs))
+    
+    def _filename_template(self, custom_naming, custom_suffix, prefix):
+        """
+        Build a filename template with a {n} placeholder for the table number.
+        
+        The PDF stem and suffix are resolved once so a loop over many tables
+        only has to fill in the number.
+        """
+        base_name = self.pdf_path.stem  # Gets 'coa-2023' from 'coa-2023.pdf'
+        
+        if custom_naming:
+            # Default naming for appropriations-donations
+            suffix = custom_suffix or 'appropriations-donations'
+            return f"{base_name}--{suffix}_table{{n}}.csv"
+        return f"{base_name}_{prefix}_{{n}}.csv"
+    
+    def generate_custom_filename(self, table_number, custom_suffix=None):
+        """
+        Generate custom filename for appropriations-donations tables.
+        
+        Args:
+            table_number: Table number (1, 2, 3, etc.)
+            custom_suffix: Optional custom suffix to add after the base name
+        
+        Returns:
+            String filename in format: coa-2023--appropriations-donations_table<number>.csv
+        """
+        return self._filename_template(True, custom_suffix, None).format(n=table_number)
+    
+    def save_tables_to_csv(self, tables, output_path=None, prefix="table", custom_naming=False, custom_suffix=None,
+                           concat=False, normalize=False, infer_types=False):
+        """
+        Save extracted tables to CSV files in the csv_output folder.
+        
+        Tables may also be passed as an iterator (e.g. from iter_tables_parallel);
+        each table is then written as soon as it is produced, so the whole set
+        never has to be held in memory at once.
+        
+        Args:
+            tables: List or iterator of DataFrames
+            output_path: Output file path (for single table) or directory (for multiple)
+            prefix: Prefix for multiple table files (used when custom_naming=False)
+            custom_naming: Use custom naming pattern (coa-2023--appropriations-donations_table<number>)
+            custom_suffix: Custom suffix for naming pattern
+            concat: Merge all tables into a single CSV file instead of one file per table
+            normalize: Apply Unicode NFKC normalization and collapse whitespace in text cells
+            infer_types: Convert columns whose non-empty cells are all numbers to numbers
+        
+        Returns:
+            List of saved file paths
+        """
+        if not isinstance(tables, list):
+            # Peek at up to two tables to choose single- or multi-table naming,
+            # then keep streaming the rest
+            iterator = iter(tables)
+            head = list(itertools.islice(iterator, 2))
+            tables = head if len(head) < 2 else itertools.chain(head, iterator)
+            if concat:
+                tables = list(tables)
+        
+        if not tables:
+            print("No tables to save")
+            return []
+        
+        if concat and len(tables) > 1:
+            import pandas as pd
+            # One concatenation, then the single-table path writes one file
+            print(f"Merging {len(tables)} tables into one CSV file")
+            tables = [pd.concat(tables, ignore_index=True)]
+        
+        # Ensure csv_output directory exists
+        csv_output_dir = _ensure_csv_output_dir()
+        
+        saved_files = []
+        
+        if isinstance(tables, list) and len(tables) == 1:
+            # Single table
+            if output_path is None:
+                if custom_naming:
+                    output_filename = self.generate_custom_filename(1, custom_suffix)
+                else:
+                    output_filename = self.pdf_path.stem + '.csv'
+                output_path = csv_output_dir / output_filename
+            else:
+                # If output_path is provided, put it in csv_output folder
+                output_path = csv_output_dir / Path(output_path).name
+            
+            table = _normalize_text(tables[0]) if normalize else tables[0]
+            if infer_types:
+                table = _infer_types(table)
+            _write_csv(table, output_path)
+            saved_files.append(output_path)
+            print(f"Table saved to: {output_path}")
+            
+        else:
+            # Multiple tables - save to csv_output folder
+            template = self._filename_template(custom_naming, custom_suffix, prefix)
+            
+            def _write_one(i, table):
+                file_path = csv_output_dir / template.format(n=i)
+                if normalize:
+                    table = _normalize_text(table)
+                if infer_types:
+                    table = _infer_types(table)
+                _write_csv(table, file_path)
+                return file_path
+            
+            # Writes release the GIL, so tables are saved concurrently
+            max_workers = min(8, len(tables)) if isinstance(tables, list) else 8
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                saved_files = list(executor.map(_write_one, itertools.count(1), tables))
+            
+            for i, file_path in enumerate(saved_files, 1):
+                print(f"Table {i} saved to: {file_path}")
+        
+        return saved_files
+    
+    def preview_tables(self, tables, max_rows=5):
+        """Preview extracted tables."""
+        for i, table in enumerate(tables, 1):
+            row_count = len(table)
+            print(f"\n--- Table {i} Preview ---")
+            print(f"Shape: {table.shape}")
+            # Slice only the rows shown (no head() copy) and format them in one pass
+            print(table.iloc[:max_rows].to_string(max_cols=20))
+            if row_count > max_rows:
+                print(f"... ({row_count - max_rows} more rows)")
+
+
+def main():
+    # Imported here so the interactive path never loads argparse
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Extract tables from PDF files to CSV')
+    parser.add_argument('pdf_file', nargs='?', help='Input PDF file path (auto-detected if not provided)')
+    parser.add_argument('output', nargs='?', help='Output CSV file or directory path')
+    parser.add_argument('--method', choices=['pymupdf', 'pdfplumber', 'tabula', 'camelot', 'auto'], 
+                       default='auto', help='Extraction method to use')
+    parser.add_argument('--pages', default='all', 
+                       help='Pages to extract (e.g., "all", "1", "1,2,3")')
+    parser.add_argument('--preview', action='store_true', 
+                       help='Preview extracted tables before saving')
+    parser.add_argument('--flavor', choices=['stream', 'lattice'], 
+                       default='stream', help='Camelot detection flavor')
+    parser.add_argument('--column-tol', type=int, default=0,
+                       help='Camelot column tolerance (0=strict, higher=more lenient)')
+    parser.add_argument('--row-tol', type=int, default=2,
+                       help='Camelot row tolerance for stream flavor')
+    parser.add_argument('--try-both-flavors', action='store_true',
+                       help='Try both camelot flavors and use the one with more columns')
+    parser.add_argument('--prescan', action='store_true',
+                       help='Only run camelot on pages that look like they hold tables '
+                            '(faster; sparse borderless tables can be missed)')
+    
+    # Custom naming options
+    parser.add_argument('--custom-naming', action='store_true',
+                       help='Use custom naming pattern: filename--appropriations-donations_table<number>')
+    parser.add_argument('--custom-suffix', type=str, default='appropriations-donations',
+                       help='Custom suffix for naming (default: appropriations-donations)')
+    
+    parser.add_argument('--workers', type=int, default=min(os.cpu_count() or 1, 4),
+                       help='Worker processes for page-parallel extraction (1 = no parallelism)')
+    parser.add_argument('--normalize', action='store_true',
+                       help='Normalize Unicode (NFKC) and collapse whitespace in text cells before saving')
+    parser.add_argument('--infer-types', action='store_true',
+                       help='Write columns whose non-empty cells are all numbers as numbers')
+    parser.add_argument('--concat', action='store_true',
+                       help='Merge all extracted tables into a single CSV file')
+    
+    parser.add_argument('--force-refresh', action='store_true',
+                       help='Ignore cached results in csv_output/.cache and extract again')
+    
+    # Batch/scripting options
+    parser.add_argument('--yes', '-y', action='store_true',
+                       help='Never prompt: pick the first PDF found and save without asking')
+    
+    args = parser.parse_args()
+    
+    # Handle case where pages might be passed as second positional argument
+    # This happens when users do: python script.py file.pdf "144,145,..."
+    if args.output and args.pages == 'all':
+        # Check if output looks like page numbers
+        if ',' in args.output and args.output.replace(',', '').replace(' ', '').isdigit():
+            print(f"Interpreting '{args.output}' as pages parameter")
+            args.pages = args.output
+            args.output = None
+    
+    # Get PDF file path - use provided argument or auto-detect
+    pdf_file = args.pdf_file
+    already_validated = False
+    if not pdf_file:
+        print("No PDF file specified. Looking for PDF files in pdf_input directory...")
+        pdf_file = select_pdf_file_automatically(assume_yes=args.yes, allow_multiple=True)
+        if not pdf_file:
+            print("No PDF files found in pdf_input directory and none specified.")
+            return 1
+        # Came from a directory scan, so it is known to exist
+        already_validated = True
+    
+    try:
+        # Prepare extraction parameters
+        extract_params = {}
+        if args.pages != 'all':
+            if args.method in ['pymupdf', 'pdfplumber', 'tabula', 'auto']:
+                if ',' in args.pages:
+                    extract_params['pages'] = [int(p.strip()) for p in args.pages.split(',')]
+                else:
+                    extract_params['pages'] = [int(args.pages)]
+            else:  # camelot
+                extract_params['pages'] = args.pages
+        
+        if args.method == 'camelot':
+            extract_params['flavor'] = args.flavor
+            extract_params['column_tol'] = args.column_tol
+            extract_params['row_tol'] = args.row_tol
+        
+        if args.prescan and args.method in ['camelot', 'auto']:
+            extract_params['prescan'] = True
+        
+        if isinstance(pdf_file, list):
+            # Unattended run over every PDF in pdf_input: one process per file
+            unsupported = [option for option, given in (('--preview', args.preview),
+                                                        ('--try-both-flavors', args.try_both_flavors))
+                           if given]
+            if unsupported:
+                print(f"Error: {' and '.join(unsupported)} can't be used when processing every PDF "
+                      f"in pdf_input; pass a single PDF file instead")
+                return 1
+            
+            save_options = {
+                'custom_naming': args.custom_naming,
+                'custom_suffix': args.custom_suffix,
+                'concat': args.concat,
+                'normalize': args.normalize,
+                'infer_types': args.infer_types,
+            }
+            workers = max(1, min(args.workers, len(pdf_file)))
+            print(f"Processing {len(pdf_file)} PDF files with {workers} worker process(es)...")
+            
+            from concurrent.futures import ProcessPoolExecutor
+            
+            saved_count = 0
+            failed = 0
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(_extract_pdf_to_csv, path, args.method, extract_params,
+                                    save_options, args.force_refresh): path
+                    for path in pdf_file
+                }
+                for future in as_completed(futures):
+                    try:
+                        saved_count += len(future.result())
+                    except Exception as e:
+                        print(f"Error processing {futures[future]}: {e}")
+                        failed += 1
+            
+            print(f"\nSaved {saved_count} CSV file(s) from {len(pdf_file) - failed} of {len(pdf_file)} PDF file(s)")
+            return 1 if failed else 0
+        
+        # Initialize extractor
+        extractor = PDFTableExtractor(pdf_file, _already_validated=already_validated)
+        
+        if args.method == 'camelot' and args.try_both_flavors:
+            print("Trying both camelot flavors to maximize column detection...")
+            # Try both flavors and pick the one with more columns
+            stream_params = extract_params.copy()
+            stream_params['flavor'] = 'stream'
+            lattice_params = extract_params.copy()
+            lattice_params['flavor'] = 'lattice'
+            
+            # One after the other: camelot's Ghostscript backend is not thread-safe
+            stream_tables = extractor.extract_with_camelot(**stream_params)
+            lattice_tables = extractor.extract_with_camelot(**lattice_params)
+            
+            # Compare results
+            stream_cols = _max_columns(stream_tables)
+            lattice_cols = _max_columns(lattice_tables)
+            
+            if stream_cols >= lattice_cols:
+                print(f"Stream flavor found more columns ({stream_cols} vs {lattice_cols})")
+                tables = stream_tables
+            else:
+                print(f"Lattice flavor found more columns ({lattice_cols} vs {stream_cols})")
+                tables = lattice_tables
+            
+        elif args.preview or args.concat:
+            # Extract tables, spreading the pages over worker processes
+            tables = extractor.extract_tables_parallel(method=args.method, workers=args.workers,
+                                                       force_refresh=args.force_refresh, **extract_params)
+            
+        else:
+            # Nothing needs the whole list up front, so write each table as it is extracted
+            tables = extractor.iter_tables_parallel(method=args.method, workers=args.workers,
+                                                    force_refresh=args.force_refresh, **extract_params)
+        
+        if isinstance(tables, list) and not tables:
+            print("No tables found in the PDF file.")
+            return 1
+        
+        # Preview tables if requested
+        if args.preview:
+            extractor.preview_tables(tables)
+            
+            if not args.yes:
+                response = input("\nProceed with saving? (y/n): ").lower().strip()
+                if response not in ['y', 'yes']:
+                    print("Operation cancelled.")
+                    return 0
+        
+        # Save tables to CSV
+        saved_files = extractor.save_tables_to_csv(
+            tables, 
+            args.output, 
+            custom_naming=args.custom_naming, 
+            custom_suffix=args.custom_suffix,
+            concat=args.concat,
+            normalize=args.normalize,
+            infer_types=args.infer_types
+        )
+        
+        if not saved_files:
+            print("No tables found in the PDF file.")
+            return 1
+        
+        table_count = len(tables) if isinstance(tables, list) else len(saved_files)
+        print(f"\nSuccessfully extracted {table_count} table(s) to {len(saved_files)} CSV file(s)")
+        
+        return 0
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+
+
+def interactive_main():
+    """Guided extraction used when the script is run without arguments."""
+    print("PDF Table Extractor")
+    print("==================")
+    print("Looking for PDF files in pdf_input folder...")
+    print("CSV files will be saved to csv_output folder...")
+    
+    # Try to auto-detect PDF files first
+    pdf_file = get_pdf_file_path()
+    
+    if not pdf_file:
+        print("No file specified. Exiting.")
+        return 1
+    
+    try:
+        extractor = PDFTableExtractor(pdf_file)
+        tables = extractor.extract_tables()
+        
+        if tables:
+            extractor.preview_tables(tables)
+            
+            save = input("\nSave tables to CSV? (y/n): ").lower().strip()
+            if save in ['y', 'yes']:
+                # In interactive mode, default to custom naming for appropriations-donations
+                saved_files = extractor.save_tables_to_csv(
+                    tables, 
+                    custom_naming=True, 
+                    custom_suffix='appropriations-donations'
+                )
+                print(f"Saved {len(saved_files)} CSV file(s)")
+        else:
+            print("No tables found in the PDF.")
+            
+    except Exception as e:
+        print(f"Error: {e}")
+        return 1
+    
+    return 0
+
+
+def run():
+    """Entry point: CLI mode with arguments, interactive mode without."""
+    # Check if running with arguments
+    if len(sys.argv) > 1:
+        return main()
+    return interactive_main()
+
+
+if __name__ == "__main__":
+    sys.exit(run())
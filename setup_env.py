@@ -7,27 +7,107 @@ This script helps set up the complete environment including Java for tabula-py.
 
 import os
 import sys
-import subprocess
+import shutil
 import platform
 import zipfile
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
+
+from _setup_common import cached_java_check
 
 def check_java():
     """Check if Java is available."""
-    try:
-        result = subprocess.run(['java', '-version'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Java is already installed and available")
-            print(result.stderr.split('\n')[0])  # Java version info goes to stderr
-            return True
-    except FileNotFoundError:
-        pass
+    java = cached_java_check()
+    if java:
+        print("✅ Java is already installed and available")
+        print(java[1])
+        return True
     
     print("❌ Java not found in system PATH")
     return False
 
+# Download/extract tuning: 1 MB copy buffer, parallel Range segments and
+# extraction threads (zlib releases the GIL while inflating)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_SEGMENTS = 4
+EXTRACT_WORKERS = 4
+
+def _download_range(url, dest, start, end):
+    """Download bytes start..end of url into the same offsets of dest."""
+    request = urllib.request.Request(url, headers={"Range": f"bytes={start}-{end}"})
+    with urllib.request.urlopen(request, timeout=60) as response, open(dest, "r+b") as f:
+        if response.status != 206:
+            raise IOError("Server ignored the Range request")
+        f.seek(start)
+        shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+
+def _download_segmented(url, dest):
+    """
+    Download url to dest as parallel Range segments.
+    
+    Returns False without downloading if the server doesn't advertise Range
+    support or the file is too small to be worth splitting.
+    """
+    with urllib.request.urlopen(urllib.request.Request(url, method="HEAD"), timeout=60) as response:
+        size = int(response.headers.get("Content-Length") or 0)
+        ranges_ok = response.headers.get("Accept-Ranges") == "bytes"
+    
+    if not ranges_ok or size <= DOWNLOAD_SEGMENTS * DOWNLOAD_CHUNK_SIZE:
+        return False
+    
+    with open(dest, "wb") as f:
+        f.truncate(size)  # Preallocate so each segment writes in place
+    
+    segment = size // DOWNLOAD_SEGMENTS
+    bounds = [(i * segment, size - 1 if i == DOWNLOAD_SEGMENTS - 1 else (i + 1) * segment - 1)
+              for i in range(DOWNLOAD_SEGMENTS)]
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as executor:
+        for future in [executor.submit(_download_range, url, dest, start, end)
+                       for start, end in bounds]:
+            future.result()
+    return True
+
+def download_file(url, dest):
+    """
+    Download url to dest.
+    
+    If the server supports Range requests the file is fetched as several
+    segments in parallel (servers often cap per-connection speed); otherwise,
+    or if anything goes wrong with that (some servers reject HEAD), it is
+    streamed over one connection with a large buffer.
+    """
+    try:
+        if _download_segmented(url, dest):
+            return
+    except Exception as e:
+        print(f"Segmented download failed ({e}), retrying as a single stream...")
+    
+    with urllib.request.urlopen(url, timeout=60) as response, open(dest, "wb") as f:
+        shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+
+def _extract_members(zip_path, members, dest):
+    """Extract some members of a zip archive (runs in a worker thread)."""
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        for member in members:
+            try:
+                zip_ref.extract(member, dest)
+            except FileExistsError:
+                # Another thread created the parent folder at the same moment
+                zip_ref.extract(member, dest)
+
+def extract_zip(zip_path, dest):
+    """Extract a zip archive using several threads, each with its own handle."""
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        members = zip_ref.namelist()
+    
+    groups = [members[i::EXTRACT_WORKERS] for i in range(EXTRACT_WORKERS)]
+    with ThreadPoolExecutor(max_workers=EXTRACT_WORKERS) as executor:
+        for future in [executor.submit(_extract_members, zip_path, group, dest)
+                       for group in groups if group]:
+            future.result()
+
 def download_portable_java():
     """Download and setup portable Java."""
     java_dir = Path("java_portable")
@@ -48,11 +128,10 @@ def download_portable_java():
     
     try:
         print(f"Downloading from: {java_url}")
-        urllib.request.urlretrieve(java_url, java_file)
+        download_file(java_url, java_file)
         
         print("📦 Extracting Java...")
-        with zipfile.ZipFile(java_file, 'r') as zip_ref:
-            zip_ref.extractall(".")
+        extract_zip(java_file, ".")
         
         # Rename the extracted folder
         extracted_folders = [f for f in os.listdir(".") if f.startswith("jdk")]
@@ -69,6 +148,34 @@ def download_portable_java():
         print(f"❌ Error downloading Java: {e}")
         return None
 
+# Static text of the activate_env scripts; only the Java lines are filled in
+TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
+
+def _render_template(name, **values):
+    """Fill in a templates/ file; other $ references (PowerShell variables) are left as is."""
+    template = Template((TEMPLATE_DIR / name).read_text(encoding="utf-8"))
+    return template.safe_substitute(values)
+
+def write_activation_scripts(java_home=None, java_bin=None):
+    """
+    Write activate_env.bat and activate_env.ps1.
+    
+    With java_home/java_bin the scripts also point JAVA_HOME and PATH at a
+    portable Java; without them they rely on the system installation.
+    """
+    for shell in ("bat", "ps1"):
+        if java_home:
+            java_setup = _render_template(f"java_env.{shell}.tmpl",
+                                          java_home=java_home, java_bin=java_bin)
+            java_source = "Portable Installation"
+        else:
+            java_setup = ""
+            java_source = "System Installation"
+        
+        with open(f"activate_env.{shell}", "w", encoding="utf-8") as f:
+            f.write(_render_template(f"activate_env.{shell}.tmpl",
+                                     java_setup=java_setup, java_source=java_source))
+
 def setup_java_environment(java_dir):
     """Setup environment variables for Java."""
     if not java_dir or not java_dir.exists():
@@ -77,54 +184,7 @@ def setup_java_environment(java_dir):
     java_home = java_dir.absolute()
     java_bin = java_home / "bin"
     
-    # Create activation script for the environment
-    activate_script = """@echo off
-REM Activate PDF extraction environment with Java
-
-REM Activate Python virtual environment
-call "%~dp0pdf_env\\Scripts\\activate.bat"
-
-REM Set Java environment
-set JAVA_HOME={java_home}
-set PATH={java_bin};%PATH%
-
-echo.
-echo ✅ PDF Extraction Environment Activated
-echo ✅ Python: Virtual Environment
-echo ✅ Java: Portable Installation
-echo.
-echo Usage:
-echo   python pdf-extract.py
-echo   python pdf-extract.py --help
-echo.
-""".format(java_home=java_home, java_bin=java_bin)
-    
-    with open("activate_env.bat", "w") as f:
-        f.write(activate_script)
-    
-    # Create PowerShell activation script
-    ps_activate_script = """# Activate PDF extraction environment with Java
-
-# Activate Python virtual environment
-& "$PSScriptRoot\\pdf_env\\Scripts\\Activate.ps1"
-
-# Set Java environment
-$env:JAVA_HOME = "{java_home}"
-$env:PATH = "{java_bin};$env:PATH"
-
-Write-Host ""
-Write-Host "✅ PDF Extraction Environment Activated" -ForegroundColor Green
-Write-Host "✅ Python: Virtual Environment" -ForegroundColor Green  
-Write-Host "✅ Java: Portable Installation" -ForegroundColor Green
-Write-Host ""
-Write-Host "Usage:"
-Write-Host "  python pdf-extract.py"
-Write-Host "  python pdf-extract.py --help"
-Write-Host ""
-""".format(java_home=java_home, java_bin=java_bin)
-    
-    with open("activate_env.ps1", "w") as f:
-        f.write(ps_activate_script)
+    write_activation_scripts(java_home, java_bin)
     
     print("✅ Environment activation scripts created:")
     print("   - activate_env.bat (Command Prompt)")
@@ -137,15 +197,9 @@ def test_environment():
     print("\n🧪 Testing environment...")
     
     # Test Java
-    try:
-        result = subprocess.run(['java', '-version'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Java test passed")
-        else:
-            print("❌ Java test failed")
-            return False
-    except FileNotFoundError:
+    if cached_java_check():
+        print("✅ Java test passed")
+    else:
         print("❌ Java not found")
         return False
     
@@ -209,45 +263,7 @@ def main():
             return 1
     else:
         print("✅ Java is available, creating activation scripts...")
-        # Create activation scripts without portable Java
-        activate_script = """@echo off
-REM Activate PDF extraction environment
-
-REM Activate Python virtual environment
-call "%~dp0pdf_env\\Scripts\\activate.bat"
-
-echo.
-echo ✅ PDF Extraction Environment Activated
-echo ✅ Python: Virtual Environment
-echo ✅ Java: System Installation
-echo.
-echo Usage:
-echo   python pdf-extract.py
-echo   python pdf-extract.py --help
-echo.
-"""
-        
-        with open("activate_env.bat", "w") as f:
-            f.write(activate_script)
-        
-        ps_activate_script = """# Activate PDF extraction environment
-
-# Activate Python virtual environment
-& "$PSScriptRoot\\pdf_env\\Scripts\\Activate.ps1"
-
-Write-Host ""
-Write-Host "✅ PDF Extraction Environment Activated" -ForegroundColor Green
-Write-Host "✅ Python: Virtual Environment" -ForegroundColor Green  
-Write-Host "✅ Java: System Installation" -ForegroundColor Green
-Write-Host ""
-Write-Host "Usage:"
-Write-Host "  python pdf-extract.py"
-Write-Host "  python pdf-extract.py --help"
-Write-Host ""
-"""
-        
-        with open("activate_env.ps1", "w") as f:
-            f.write(ps_activate_script)
+        write_activation_scripts()
         
         print("✅ Environment activation scripts created")
     
@@ -7,8 +7,11 @@ Ensures all dependencies are installed in virtual environment only.
 import sys
 import subprocess
 import os
+import shutil
 from pathlib import Path
 
+from _setup_common import cached_java_check
+
 def check_virtual_env():
     """Check if we're running in a virtual environment."""
     return hasattr(sys, 'real_prefix') or (
@@ -44,9 +47,18 @@ def main():
     # Install packages in virtual environment
     try:
         print("\n📦 Installing Python packages in virtual environment...")
-        subprocess.run([
-            sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-        ], check=True)
+        uv = shutil.which("uv")
+        if uv:
+            # uv resolves and installs in parallel, much faster than pip
+            print("   Using uv")
+            subprocess.run([
+                uv, "pip", "install", "--python", sys.executable, "-r", "requirements.txt"
+            ], check=True)
+        else:
+            # Prefer prebuilt wheels so packages like opencv/jpype skip source builds
+            subprocess.run([
+                sys.executable, "-m", "pip", "install", "--prefer-binary", "-r", "requirements.txt"
+            ], check=True)
         print("✅ All Python packages installed successfully!")
         
     except subprocess.CalledProcessError:
@@ -54,15 +66,9 @@ def main():
         return 1
     
     # Check Java
-    try:
-        result = subprocess.run(["java", "-version"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Java is available")
-        else:
-            print("⚠️  Java not found - install Java 11+ for full functionality")
-            print("   See JAVA_SETUP.md for installation instructions")
-    except FileNotFoundError:
+    if cached_java_check():
+        print("✅ Java is available")
+    else:
         print("⚠️  Java not found - install Java 11+ for full functionality")
         print("   See JAVA_SETUP.md for installation instructions")
     
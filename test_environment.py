@@ -5,15 +5,30 @@ Test script to verify the PDF extraction environment is working correctly.
 
 import sys
 import os
+import argparse
+import importlib
+import shutil
 from pathlib import Path
 
-def test_python_environment():
-    """Test Python environment and packages."""
+from _setup_common import cached_java_check
+
+# Packages each extraction backend needs, as (import name, package name)
+BACKEND_PACKAGES = {
+    'tabula': [('tabula', 'tabula-py'), ('jpype', 'jpype1')],
+    'camelot': [('camelot', 'camelot-py')],
+    'pdfplumber': [('pdfplumber', 'pdfplumber')],
+    'pymupdf': [('pymupdf', 'pymupdf')],
+}
+
+# Backends that run on the JVM; Java is only tested for these
+JAVA_BACKENDS = {'tabula'}
+
+def test_core_packages():
+    """Test Python environment and the packages every backend needs."""
     print("🐍 Testing Python Environment...")
     print(f"   Python version: {sys.version}")
     print(f"   Virtual env: {sys.prefix}")
     
-    # Test required packages
     try:
         import pandas
         print(f"   ✅ pandas {pandas.__version__}")
@@ -21,19 +36,21 @@ def test_python_environment():
         print("   ❌ pandas not installed")
         return False
     
-    try:
-        import tabula
-        print(f"   ✅ tabula-py installed")
-    except ImportError:
-        print("   ❌ tabula-py not installed")
-        return False
+    return True
+
+def test_optional_packages(backend):
+    """Test the packages needed by the selected extraction backend."""
+    print(f"\n📦 Testing {backend} backend packages...")
     
-    try:
-        import jpype
-        print(f"   ✅ jpype1 {jpype.__version__}")
-    except ImportError:
-        print("   ❌ jpype1 not installed")
-        return False
+    for module_name, package_name in BACKEND_PACKAGES[backend]:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            print(f"   ❌ {package_name} not installed")
+            return False
+        
+        version = getattr(module, '__version__', None)
+        print(f"   ✅ {package_name} {version}" if version else f"   ✅ {package_name} installed")
     
     return True
 
@@ -42,34 +59,26 @@ def test_java():
     print("\n☕ Testing Java...")
     
     # Try to find Java in common locations
-    possible_java_paths = [
-        r"C:\Program Files\Microsoft\jdk-11.*\bin\java.exe",
-        r"C:\Program Files\Eclipse Adoptium\jdk-11.*\bin\java.exe", 
-        r"C:\Program Files\Java\jdk*\bin\java.exe",
-        "java"  # System PATH
+    java_search_dirs = [
+        (r"C:\Program Files\Microsoft", "jdk-11.*/bin/java.exe"),
+        (r"C:\Program Files\Eclipse Adoptium", "jdk-11.*/bin/java.exe"),
+        (r"C:\Program Files\Java", "jdk*/bin/java.exe"),
     ]
     
-    import subprocess
-    import glob
-    
-    for java_path in possible_java_paths:
-        try:
-            if "*" in java_path:
-                # Handle wildcard paths
-                matches = glob.glob(java_path)
-                if not matches:
-                    continue
-                java_path = matches[0]
-            
-            result = subprocess.run([java_path, '-version'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version_line = result.stderr.split('\n')[0] if result.stderr else "Unknown version"
-                print(f"   ✅ Java found: {java_path}")
-                print(f"   ✅ {version_line}")
-                return java_path
-        except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-            continue
+    # One PATH lookup first; the install folders are only globbed if that fails
+    java_path = shutil.which("java")
+    if not java_path:
+        for base, pattern in java_search_dirs:
+            match = next(Path(base).glob(pattern), None)
+            if match:
+                java_path = str(match)
+                break
+    
+    java = cached_java_check(java_path) if java_path else None
+    if java:
+        print(f"   ✅ Java found: {java[0]}")
+        print(f"   ✅ {java[1]}")
+        return java[0]
     
     print("   ❌ Java not found")
     print("   💡 Try restarting your terminal after Java installation")
@@ -106,10 +115,7 @@ def test_pdf_extractor():
     
     try:
         # Import our extractor
-        import importlib.util
-        spec = importlib.util.spec_from_file_location("pdf_extract", "pdf-extract.py")
-        pdf_extract = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(pdf_extract)
+        import pdf_extract
         
         print("   ✅ PDF extractor script loads successfully")
         
@@ -125,33 +131,46 @@ def test_pdf_extractor():
 
 def main():
     """Run all tests."""
+    parser = argparse.ArgumentParser(description='Verify the PDF extraction environment')
+    parser.add_argument('--backend', choices=sorted(BACKEND_PACKAGES), default='tabula',
+                       help='Extraction backend to check packages for (default: tabula); '
+                            'Java is only tested for tabula')
+    args = parser.parse_args()
+    needs_java = args.backend in JAVA_BACKENDS
+    
     print("🧪 PDF Table Extractor - Environment Test")
     print("=" * 50)
     
     all_passed = True
     
     # Test Python environment
-    if not test_python_environment():
+    if not test_core_packages():
         all_passed = False
     
-    # Test Java
-    java_path = test_java()
-    
-    # Test tabula with Java
-    if not test_tabula_with_java():
+    if not test_optional_packages(args.backend):
         all_passed = False
     
+    if needs_java:
+        # Test Java
+        java_ok = test_java()
+        
+        # Test tabula with Java
+        if not test_tabula_with_java():
+            all_passed = False
+    else:
+        java_ok = True
+    
     # Test PDF extractor
     if not test_pdf_extractor():
         all_passed = False
     
     print("\n" + "=" * 50)
-    if all_passed and java_path:
+    if all_passed and java_ok:
         print("🎉 All tests passed! Your environment is ready to use.")
         print("\nNext steps:")
         print("   python pdf-extract.py          # Auto-detect and extract")
         print("   python pdf-extract.py --help   # See all options")
-    elif java_path:
+    elif java_ok:
         print("⚠️  Environment mostly ready, but some issues detected.")
         print("   Your environment should still work for basic functionality.")
     else: